@@ -6,7 +6,7 @@ It serves as a proof of concept for a personal AI assistant capable of performin
 tasks through voice commands and natural language processing.
 
 Key Features:
-1. Voice Activation: Listens for the activation keyword "Ada" to start processing commands.
+1. Voice Activation: Listens locally for a wake word before transcribing and processing commands.
 2. Natural Language Processing: Utilizes advanced language models for understanding and
    responding to user queries.
 3. Multi-Modal AI Integration: Incorporates multiple AI models including GPT-4 and Gemini 1.5
@@ -23,11 +23,11 @@ Main Components:
   code generation, system configuration).
 - Helper Functions: Provide utility functionalities like text processing and file handling.
 - Audio I/O Functions: Manage audio recording, transcription, and text-to-speech conversion.
-- Main Loop: Continuously listens for the activation keyword and processes user commands.
+- Main Loop: Continuously listens for the wake word and processes the user commands that follow it.
 
 Dependencies:
 - External Modules: tkinter, pydantic, sounddevice, elevenlabs, openai, google.generativeai
-- Custom Modules: human_in_the_loop, llm, editor, parsers
+- Custom Modules: human_in_the_loop, llm, editor, parsers, semantic_cache
 
 Environment Setup:
 - Requires API keys for OpenAI, Google Cloud, ElevenLabs, and Deepgram.
@@ -36,7 +36,8 @@ Environment Setup:
 Usage:
 1. Ensure all dependencies are installed and API keys are set in the environment.
 2. Run the script to start the AI assistant.
-3. Activate the assistant by saying "Ada" followed by a command or question.
+3. Activate the assistant by saying the wake word ("alexa" by default, see WAKE_WORD_MODEL)
+   followed by a command or question.
 4. The assistant will process the request and respond audibly.
 
 Note: This is version 0.2.1 of the ADA AI Assistant, representing an early-stage
@@ -55,30 +56,46 @@ Version: 0.2.1
 # - using deepgram instead of assembly ai for audio-to-text transcription
 # - minor changes to the code generation prompts
 
-import difflib
-import json
+import asyncio
+import atexit
+import contextlib
 import os
+import queue
+import re
 import subprocess
 import sys
-import wave
+import tempfile
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from textwrap import dedent
+from typing import Iterator
 
+import diskcache
+import jsonpatch
+import numpy as np
+import orjson
 import pyperclip
 import requests
 import sounddevice as sd
-from bs4 import BeautifulSoup
+import webrtcvad
 from deepgram import (
     DeepgramClient,
+    FileSource,
     PrerecordedOptions,
 )
 from dotenv import load_dotenv
-from elevenlabs import play
+from elevenlabs import play, stream
 from elevenlabs.client import ElevenLabs
 from markdownify import markdownify
+from openwakeword.model import Model as WakeWordModel
 from pydantic import BaseModel
+from requests.adapters import HTTPAdapter
+from selectolax.lexbor import LexborHTMLParser
 
 from ada.modules import editor, human_in_the_loop, llm
+from ada.modules.semantic_cache import SemanticCache
 
 load_dotenv()
 
@@ -101,19 +118,240 @@ PERSONAL_AI_ASSISTANT_PROMPT_HEAD = dedent(f"""
 """).strip()
 
 try:
-    with open(CONFIG_FILE, "r", encoding="utf-8") as config_file:
-        configuration = json.load(config_file)
+    with open(CONFIG_FILE, "rb") as config_file:
+        configuration = orjson.loads(config_file.read())
 except FileNotFoundError:
     configuration = {
         "working_directory": None,
     }
     # write
-    with open(CONFIG_FILE, "w", encoding="utf-8") as config_file:
-        json.dump(configuration, config_file, indent=2)
+    with open(CONFIG_FILE, "wb") as config_file:
+        config_file.write(orjson.dumps(configuration, option=orjson.OPT_INDENT_2))
 
 CHANNELS = 1
+SAMPLE_RATE = 16000
 ITERATION_START_TIME = None
 
+# Voice activity detection on 30ms frames, a chunk ends after ~750ms of silence
+VAD_FRAME_SAMPLES = 480
+VAD_SILENCE_FRAMES = 25
+VAD_PRE_ROLL_FRAMES = 10
+# Give up on an activation if no speech starts within ~5s of the wake word
+VAD_MAX_LEADING_SILENCE_FRAMES = 166
+_VAD = webrtcvad.Vad(2)
+
+# Local wake word detection on 80ms frames, only the following utterance goes to Deepgram
+WAKE_WORD_MODEL = os.getenv("WAKE_WORD_MODEL", "alexa")
+WAKE_WORD_THRESHOLD = 0.5
+WAKE_WORD_FRAME_SAMPLES = 1280
+_WAKE_WORD_MODEL = WakeWordModel(
+    wakeword_models=[WAKE_WORD_MODEL], inference_framework="onnx"
+)
+
+# API clients are built once and reused so their HTTPS connections stay open
+_EL_CLIENT = ElevenLabs(
+    api_key=os.getenv("ELEVENLABS_API_KEY"),  # Defaults to ELEVEN_API_KEY from .env
+)
+_DG_CLIENT = DeepgramClient(os.getenv("DEEPGRAM_API_KEY"))
+_HTTP = requests.Session()
+_HTTP.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+_HTTP.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+
+_EVENT_LOOP = asyncio.new_event_loop()
+
+
+_BASH_ENV_MARKER = "__ADA_BASH_ENV__"
+
+
+def load_bash_profile():
+    """
+    Evaluate ~/.bash_profile once and return an environment for running bash commands.
+
+    Shell functions defined by the profile are saved to a file referenced by BASH_ENV,
+    which non-interactive bash sources on startup, so commands skip the profile itself.
+    Falls back to the current environment if the profile can't be evaluated.
+    """
+    try:
+        output = subprocess.check_output(
+            ["bash", "-lc", f"printf '{_BASH_ENV_MARKER}\\0' && env -0 && declare -f"],
+            text=True,
+            timeout=30,
+        )
+    except (OSError, subprocess.SubprocessError) as e:
+        print(f"❌ Could not load ~/.bash_profile: {e}")
+        return dict(os.environ)
+    # Skip anything the profile printed, then NUL-separated variables and the functions
+    _, _, output = output.partition(f"{_BASH_ENV_MARKER}\0")
+    *variables, functions = output.split("\0")
+    environment = dict(
+        variable.split("=", 1) for variable in variables if "=" in variable
+    )
+    if not environment:
+        print("❌ Could not read the environment from ~/.bash_profile")
+        return dict(os.environ)
+    with tempfile.NamedTemporaryFile(
+        "w", prefix="ada-bash-functions-", suffix=".sh", delete=False
+    ) as functions_file:
+        functions_file.write(functions)
+    atexit.register(os.remove, functions_file.name)
+    environment["BASH_ENV"] = functions_file.name
+    return environment
+
+
+_BASH_ENV = load_bash_profile()
+
+SCRAPE_CACHE_DIR = os.getenv("SCRAPE_CACHE_DIR", "./.scrape_cache")
+_SCRAPE_CACHE = diskcache.Cache(SCRAPE_CACHE_DIR)
+SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?])\s+")
+TTS_MAX_PARALLEL_SENTENCES = 3
+
+# --------------------- Prompt Templates ---------------------
+# Dedented once at import time; workflows only substitute the dynamic values.
+
+# Sent unchanged as the Gemini system instruction, the templates below are only the user turn
+PERSONAL_AI_ASSISTANT_SYSTEM_PROMPT = (
+    PERSONAL_AI_ASSISTANT_PROMPT_HEAD
+    + "\nWe don't like small talk so we always steer our conversation back toward creating, building, product development, designing, and coding."
+)
+
+
+RUN_BASH_COMMAND_PROMPT_TEMPLATE = dedent("""
+    You are a friendly, ultra helpful, attentive, concise AI assistant named '{assistant_name}'.
+    You work with your human companion '{companion_name}' to build valuable experience through software.
+
+    Here are available bash COMMANDS you can run:
+
+    # chrome browser
+    browser() {{
+       open -a 'Google Chrome' $1
+    }}
+
+    # typescript playground
+    playt() {{
+       cursor "/Users/ravix/Documents/projects/experimental/playt"
+    }}
+
+    chats() {{
+       browser "https://aistudio.google.com/app/prompts/new_chat"
+       browser "https://console.anthropic.com/workbench"
+       browser "https://chat.openai.com/"
+    }}
+
+    Based on the COMMAND - RESPOND WITH THE COMMAND to run in this JSON format: {{bash_command_to_run: ''}}.
+
+    Exclude any new lines or code blocks from the command. Respond with exclusively JSON.
+
+    Your COMMAND will be immediately run and the output will be returned to the user.
+
+    You've been asked to run the following bash COMMAND: '{prompt}'
+""").strip()
+
+RUN_BASH_COMMAND_DONE_PROMPT_TEMPLATE = dedent("""
+    Let your human companion know you've finished running the command and what you can do next.
+
+    You've just helped your human companion run this bash COMMAND: {command}
+
+    The COMMAND printed this OUTPUT:
+    {output}
+""").strip()
+
+QUESTION_ANSWER_PROMPT_TEMPLATE = dedent("""
+    We like to discuss in high level details without getting too technical.
+    Respond to the following question: {prompt}
+""").strip()
+
+SOFT_TALK_PROMPT_TEMPLATE = dedent("""
+    Respond to the following prompt: {prompt}
+""").strip()
+
+SHELL_COMMAND_PROMPT_TEMPLATE = dedent("""
+    You are a highly efficient, code-savvy AI assistant named '{assistant_name}'.
+    You work with your human companion '{companion_name}' to build valuable experience through software.
+    Your task is to provide a JSON response with the following format: {{command_to_run: ''}} detailing the shell command
+    for the macOS bash shell based on the QUESTION below.
+
+    After generating the response, your command will be attached DIRECTLY to your human companions clipboard to be run.
+
+    QUESTION: {prompt}
+""").strip()
+
+SHELL_COMMAND_DONE_PROMPT_TEMPLATE = dedent("""
+    Let your human companion know you've attached it and let them know you're ready for the next task.
+
+    You've just attached the command '{command}' to your human companion's clipboard like they've requested.
+""").strip()
+
+SUMMARIZE_DIFF_PROMPT_TEMPLATE = dedent("""
+    You'll concisely summarize the changes made to the file in a 1 sentence summary.
+    The point is to communicate and acknowledge the changes made to the file.
+
+    Your companion has just finished editing the {file}. The changes are listed as JSON patch operations:
+
+    {diff}
+""").strip()
+
+EXAMPLE_CODE_FILE_NAME_PROMPT_TEMPLATE = dedent("""
+    You are a friendly, ultra helpful, attentive, concise AI assistant named '{assistant_name}'.
+    You work with your human companion '{companion_name}' to build valuable experience through software.
+    We both like short, concise, back-and-forth conversations.
+
+    You've just generated the following CODE below for your human companion.
+    Create a file name for the code file that will be written to the following directory: {working_directory}
+    The file name should be unique and descriptive of the code it contains.
+    Respond exclusively with the file name in the following JSON format: {{file_name: ''}}.
+
+    CODE:
+    {code}
+""").strip()
+
+CONFIGURE_ASSISTANT_PROMPT = dedent("""
+    You've just opened a configuration file for your human companion.
+    Let your human companion know you've opened the file and are ready for them to edit it.
+""").strip()
+
+END_CONVERSATION_PROMPT_TEMPLATE = dedent("""
+    We're wrapping up our work for the day. You're a great engineering partner.
+    Thanks for all your help and for being a great engineering partner.
+
+    Respond to your human companions closing thoughts: {prompt}
+""").strip()
+
+FEEDBACK_PROMPT_TEMPLATE = dedent("""
+    Concisely communicate the following message to your human companion: '{message}'
+""").strip()
+
+# Cached feedback is only reused while the persona and template are unchanged (e.g. names)
+FEEDBACK_CACHE_FILE = os.getenv("FEEDBACK_CACHE_FILE", "./feedback_cache.pkl")
+feedback_cache = SemanticCache(
+    FEEDBACK_CACHE_FILE,
+    context=PERSONAL_AI_ASSISTANT_SYSTEM_PROMPT + FEEDBACK_PROMPT_TEMPLATE,
+)
+
+
+# --------------------- Response Models ---------------------
+# Defined once at import time, so their validators are built once instead of on every workflow run.
+
+
+class VueComponentResponse(BaseModel):
+    vue_component: str
+
+
+class FileNameResponse(BaseModel):
+    file_name: str
+
+
+class BashCommandResponse(BaseModel):
+    bash_command_to_run: str
+
+
+class ShellCommandModel(BaseModel):
+    command_to_run: str
+
+
+class ExampleCodeResponse(BaseModel):
+    code: str
+
+
 # --------------------- Agent Workflows ---------------------
 
 
@@ -141,28 +379,18 @@ def image_to_vue_component_workflow(prompt: str):
     Generate a Vue component from an image
     """
 
-    class VueComponentResponse(BaseModel):
-        vue_component: str
-
-    class FileNameResponse(BaseModel):
-        file_name: str
-
-    speak(build_feedback_prompt("Select an image to generate a Vue component from."))
+    speak_feedback("Select an image to generate a Vue component from.")
 
     open_file_path = human_in_the_loop.open_file()
 
     print(f"🎆 Image selected at {open_file_path}")
 
     if not open_file_path:
-        speak(
-            build_feedback_prompt("No image found in clipboard. Skipping this request.")
-        )
+        speak_feedback("No image found in clipboard. Skipping this request.")
         return
 
-    speak(
-        build_feedback_prompt(
-            "Okay I see the image, Now I'll generate the Vue component based on the image and your request."
-        )
+    speak_feedback(
+        "Okay I see the image, Now I'll generate the Vue component based on the image and your request."
     )
 
     component_response: VueComponentResponse = llm.gpt4t_w_vision_image_with_model(
@@ -202,10 +430,9 @@ def image_to_vue_component_workflow(prompt: str):
     with open(file_path, "w") as file:
         file.write(component_response.vue_component)
 
-    speak(
-        build_feedback_prompt(
-            f"I've created the Vue component and named it {file_name_response.file_name}. Let me know if you want to make any edits."
-        )
+    speak_feedback(
+        f"I've created the Vue component and named it {file_name_response.file_name}. Let me know if you want to make any edits.",
+        cache=False,
     )
 
     human_in_the_loop.open_file_in_editor_and_continue(file_path)
@@ -213,7 +440,7 @@ def image_to_vue_component_workflow(prompt: str):
     requested_updates = human_in_the_loop.open_editor()
 
     if not requested_updates:
-        speak(build_feedback_prompt("No changes requested. Component ready for use."))
+        speak_feedback("No changes requested. Component ready for use.")
         return
 
     component_to_update = component_response.vue_component
@@ -242,51 +469,20 @@ def image_to_vue_component_workflow(prompt: str):
     with open(file_path, "w") as file:
         file.write(update_component_response.vue_component)
 
-    speak(
-        build_feedback_prompt(
-            "I've updated the Vue component based on your feedback. What's next?"
-        )
+    speak_feedback(
+        "I've updated the Vue component based on your feedback. What's next?"
     )
 
     pass
 
 
 def run_bash_command_workflow(prompt: str):
-    run_bash_prompt = dedent(
-        f"""You are a friendly, ultra helpful, attentive, concise AI assistant named '{PERSONAL_AI_ASSISTANT_NAME}'.
-                   You work with your human companion '{HUMAN_COMPANION_NAME}' to build valuable experience through software.
-
-                   You've been asked to run the following bash COMMAND: '{prompt}'
-
-                   Here are available bash COMMANDS you can run:
-
-                   # chrome browser
-                   browser() {{
-                      open -a 'Google Chrome' $1
-                   }}
-
-                   # typescript playground
-                   playt() {{
-                      cursor "/Users/ravix/Documents/projects/experimental/playt"
-                   }}
-
-                   chats() {{
-                      browser "https://aistudio.google.com/app/prompts/new_chat"
-                      browser "https://console.anthropic.com/workbench"
-                      browser "https://chat.openai.com/"
-                   }}
-
-                   Based on the COMMAND - RESPOND WITH THE COMMAND to run in this JSON format: {{bash_command_to_run: ''}}.
-
-                   Exclude any new lines or code blocks from the command. Respond with exclusively JSON.
-
-                   Your COMMAND will be immediately run and the output will be returned to the user.
-                """
+    run_bash_prompt = RUN_BASH_COMMAND_PROMPT_TEMPLATE.format(
+        assistant_name=PERSONAL_AI_ASSISTANT_NAME,
+        companion_name=HUMAN_COMPANION_NAME,
+        prompt=prompt,
     )
 
-    class BashCommandResponse(BaseModel):
-        bash_command_to_run: str
-
     response: BashCommandResponse = llm.gpt4t_w_vision_json_prompt(
         run_bash_prompt, pydantic_model=BashCommandResponse
     )
@@ -297,82 +493,71 @@ def run_bash_command_workflow(prompt: str):
 
     print(f"💻 {PERSONAL_AI_ASSISTANT_NAME} is running this command: ", command)
     try:
-        command = "source ~/.bash_profile && " + command
+        # The profile was evaluated once at startup, see load_bash_profile()
         result = subprocess.run(
             command,
             shell=True,
+            executable="/bin/bash",
+            env=_BASH_ENV,
+            capture_output=True,
+            text=True,
+            timeout=30,
         )
-        print(f"💻 Command executed successfully: {command}")
+        print(f"💻 Command executed with exit code {result.returncode}: {command}")
         print(f"💻 Output: {result.stdout}")
-    except subprocess.CalledProcessError as e:
+        if result.stderr:
+            print(f"💻 Error output: {result.stderr}")
+    except subprocess.SubprocessError as e:
         print(f"💻 Error executing command: {command}\n💻 Error: {e}")
         return
 
-    soft_talk_prompt = dedent(
-        f"""You are a friendly, ultra helpful, attentive, concise AI assistant named '{PERSONAL_AI_ASSISTANT_NAME}'.
-                  You work with your human companion '{HUMAN_COMPANION_NAME}' to build valuable experience through software.
-
-                  We both like short, concise, back-and-forth conversations.
-                  We don't like small talk so we always steer our conversation back toward creating, building, product development, designing, and coding.
-
-                  You've just helped your human companion run this bash COMMAND: {command}
-
-                  Let your human companion know you've finished running the command and what you can do next.
-               """
+    soft_talk_prompt = RUN_BASH_COMMAND_DONE_PROMPT_TEMPLATE.format(
+        command=command,
+        # Keep the tail of long outputs so the prompt stays small
+        output=(result.stdout or result.stderr)[-2000:],
     )
 
-    response = llm.gpro_1_5_prompt(soft_talk_prompt)
-
-    speak(response)
+    speak_stream(
+        llm.gpro_1_5_prompt_stream(
+            soft_talk_prompt, system_instruction=PERSONAL_AI_ASSISTANT_SYSTEM_PROMPT
+        )
+    )
 
     pass
 
 
 def question_answer_workflow(prompt: str):
-    question_answer_prompt = dedent(
-        f"""{PERSONAL_AI_ASSISTANT_PROMPT_HEAD}
-                  We don't like small talk so we always steer our conversation back toward creating, building, product development, designing, and coding.
-                  We like to discuss in high level details without getting too technical.
-                  Respond to the following question: {prompt}
-               """
-    )
+    question_answer_prompt = QUESTION_ANSWER_PROMPT_TEMPLATE.format(prompt=prompt)
 
-    response = llm.gpro_1_5_prompt(question_answer_prompt)
-
-    speak(response)
+    speak_stream(
+        llm.gpro_1_5_prompt_stream(
+            question_answer_prompt,
+            system_instruction=PERSONAL_AI_ASSISTANT_SYSTEM_PROMPT,
+        )
+    )
 
     pass
 
 
 def soft_talk_workflow(prompt: str):
-    soft_talk_prompt = dedent(
-        f"""{PERSONAL_AI_ASSISTANT_PROMPT_HEAD}
-                  We don't like small talk so we always steer our conversation back toward creating, building, product development, designing, and coding.
-                  Respond to the following prompt: {prompt}
-               """
-    )
-
-    response = llm.gpro_1_5_prompt(soft_talk_prompt)
+    soft_talk_prompt = SOFT_TALK_PROMPT_TEMPLATE.format(prompt=prompt)
 
-    speak(response)
+    speak_stream(
+        llm.gpro_1_5_prompt_stream(
+            soft_talk_prompt, system_instruction=PERSONAL_AI_ASSISTANT_SYSTEM_PROMPT
+        )
+    )
 
     return
 
 
 def shell_command_workflow(prompt: str):
-    shell_command_prompt = dedent(
-        f"""You are a highly efficient, code-savvy AI assistant named '{PERSONAL_AI_ASSISTANT_NAME}'.
-                  You work with your human companion '{HUMAN_COMPANION_NAME}' to build valuable experience through software.
-                  Your task is to provide a JSON response with the following format: {{command_to_run: ''}} detailing the shell command
-                  for the macOS bash shell to based on this question: {prompt}.
-
-                  After generating the response, your command will be attached DIRECTLY to your human companions clipboard to be run.
-               """
+    shell_command_prompt = SHELL_COMMAND_PROMPT_TEMPLATE.format(
+        assistant_name=PERSONAL_AI_ASSISTANT_NAME,
+        companion_name=HUMAN_COMPANION_NAME,
+        prompt=prompt,
     )
 
-    class ShellCommandModel(BaseModel):
-        command_to_run: str
-
     response = llm.gpt4t_w_vision_json_prompt(
         prompt=shell_command_prompt,
         pydantic_model=ShellCommandModel,  # Assuming there's a suitable model or this parameter is handled appropriately within the function.
@@ -380,46 +565,44 @@ def shell_command_workflow(prompt: str):
 
     pyperclip.copy(response.command_to_run)
 
-    completion_prompt = dedent(
-        f"""You are a friendly, ultra helpful, attentive, concise AI assistant named '{PERSONAL_AI_ASSISTANT_NAME}'.
-                  You work with your human companion '{HUMAN_COMPANION_NAME}' to build valuable experience through software.
-                  We both like short, concise, back-and-forth conversations.
-
-                  You've just attached the command '{response.command_to_run}' to your human companion's clipboard like they've requested.
-
-                  Let your human companion know you've attached it and let them know you're ready for the  next task.
-               """
+    completion_prompt = SHELL_COMMAND_DONE_PROMPT_TEMPLATE.format(
+        command=response.command_to_run,
     )
 
-    completion_response = llm.gpro_1_5_prompt(completion_prompt)
-
-    speak(completion_response)
+    speak_stream(
+        llm.gpro_1_5_prompt_stream(
+            completion_prompt, system_instruction=PERSONAL_AI_ASSISTANT_SYSTEM_PROMPT
+        )
+    )
 
 
 def summarize_diff_workflow(start: str | dict, end: str | dict, file: str):
     """
-    Summarize the diff between two strings
+    Summarize the diff between two JSON documents
     """
-    start = json.dumps(start, indent=2).splitlines()
-    end = json.dumps(end, indent=2).splitlines()
-
-    diff = difflib.unified_diff(start, end, fromfile="before", tofile="after")
-    diffed = "\n".join(diff)
-
-    summarize_prompt = dedent(f"""{PERSONAL_AI_ASSISTANT_PROMPT_HEAD}
-                  Your companion has just finished editing the {file}.
-
-                  You'll concisely summarize the changes made to the file in a 1 sentence summary.
-                  The point is to communicate and acknowledge the changes made to the file.
-
-                  The changes are:
-
-                  {diffed}
-               """)
+    # RFC 6902 operations only describe what changed, not the unchanged structure around it
+    operations = jsonpatch.make_patch(start, end).patch
+    if not operations:
+        print(f"📝 No changes made to {file}.")
+        return "no changes"
+
+    changes = []
+    for operation in operations:
+        value = (
+            orjson.dumps(operation["value"]).decode()
+            if "value" in operation
+            else operation.get("from", "")
+        )
+        changes.append(f"{operation['op']} {operation['path']} -> {value}")
+    diffed = "\n".join(changes)
 
-    summarize_response = llm.gpro_1_5_prompt(summarize_prompt)
+    summarize_prompt = SUMMARIZE_DIFF_PROMPT_TEMPLATE.format(file=file, diff=diffed)
 
-    speak(summarize_response)
+    speak_stream(
+        llm.gpro_1_5_prompt_stream(
+            summarize_prompt, system_instruction=PERSONAL_AI_ASSISTANT_SYSTEM_PROMPT
+        )
+    )
 
     return diffed
 
@@ -429,21 +612,19 @@ def configure_assistant_workflow(prompt: str):
     Configure settings for our assistant
     """
 
-    configure_prompt = dedent(f"""{PERSONAL_AI_ASSISTANT_PROMPT_HEAD}
-                  You've just opened a configuration file for your human companion.
-                  Let your human companion know you've opened the file and are ready for them to edit it.
-               """)
-
-    prompt_response = llm.gpro_1_5_prompt(prompt=configure_prompt)
-
-    speak(prompt_response)
+    speak_stream(
+        llm.gpro_1_5_prompt_stream(
+            prompt=CONFIGURE_ASSISTANT_PROMPT,
+            system_instruction=PERSONAL_AI_ASSISTANT_SYSTEM_PROMPT,
+        )
+    )
 
     global configuration
 
     previous_configuration = configuration
     updated_config = human_file_json_prompt(configuration)
-    with open(CONFIG_FILE, "w") as config_file:
-        json.dump(updated_config, config_file, indent=2)
+    with open(CONFIG_FILE, "wb") as config_file:
+        config_file.write(orjson.dumps(updated_config, option=orjson.OPT_INDENT_2))
 
     summarize_diff_workflow(
         previous_configuration, updated_config, "configuration.json"
@@ -451,16 +632,13 @@ def configure_assistant_workflow(prompt: str):
 
 
 def end_conversation_workflow(prompt: str):
-    end_prompt = dedent(f"""{PERSONAL_AI_ASSISTANT_PROMPT_HEAD}
-                  We're wrapping up our work for the day. You're a great engineering partner.
-                  Thanks for all your help and for being a great engineering partner.
+    end_prompt = END_CONVERSATION_PROMPT_TEMPLATE.format(prompt=prompt)
 
-                  Respond to your human companions closing thoughts: {prompt}
-               """)
-
-    response = llm.gpro_1_5_prompt(end_prompt)
-
-    speak(response)
+    speak_stream(
+        llm.gpro_1_5_prompt_stream(
+            end_prompt, system_instruction=PERSONAL_AI_ASSISTANT_SYSTEM_PROMPT
+        )
+    )
 
     sys.exit()
 
@@ -469,141 +647,124 @@ def example_code_workflow(prompt: str):
     """
     Generate code for a given prompt
     """
+    run_async(example_code_workflow_async(prompt))
 
-    class ExampleCodeResponse(BaseModel):
-        code: str
 
-    class ExampleCodeFileNameResponse(BaseModel):
-        file_name: str
+async def example_code_workflow_async(prompt: str):
+    """
+    Generate code for a given prompt, overlapping scraping, speech and LLM calls
+    """
 
     url_from_clipboard = pyperclip.paste()
 
     if not url_from_clipboard or "http" not in url_from_clipboard:
-        speak(
-            build_feedback_prompt(
-                "I don't see a URL on your clipboard. Please paste a URL into your editor."
-            )
+        await speak_feedback_async(
+            "I don't see a URL on your clipboard. Please paste a URL into your editor."
         )
 
-        url_from_clipboard = human_in_the_loop.open_editor()
+        url_from_clipboard = await human_in_the_loop.open_editor_async()
 
     if not url_from_clipboard:
-        speak(
-            build_feedback_prompt(
-                "Still no URL found in clipboard. Skipping this request."
-            )
+        await speak_feedback_async(
+            "Still no URL found in clipboard. Skipping this request."
         )
         return
 
     print(f"🔗 Scraping URL found in clipboard: {url_from_clipboard}")
 
-    speak(
-        build_feedback_prompt(
-            dedent("""I've found the URL in your clipboard.
-                       I'll scrape the URL and example generate code for you.
-                       But first, what about the example code would you like me to focus on?
-                    """)
-        )
+    # Scrape in the background while we talk to our human companion
+    scrape_task = asyncio.create_task(
+        asyncio.to_thread(scrape_to_markdown, url_from_clipboard)
     )
 
-    feedback_for_code_generation = human_in_the_loop.open_editor()
-
-    speak(
-        build_feedback_prompt(
-            f"Okay got it, I see you want to focus on '{feedback_for_code_generation}'. I'll generate the code for you now."
-        )
+    await speak_feedback_async(
+        dedent("""I've found the URL in your clipboard.
+                   I'll scrape the URL and example generate code for you.
+                   But first, what about the example code would you like me to focus on?
+                """)
     )
 
-    scraped_markdown = scrape_to_markdown(url_from_clipboard)
-
-    example_code_response_1: ExampleCodeResponse = llm.gpro_1_5_prompt_with_model(
-        dedent(f"""You're a professional software developer advocate that takes pride in writing good code.
-                   You take documentation, and convert it into runnable code.
-
-                   You have a new request to generate code for the following url: '{url_from_clipboard}' with a focus on '{feedback_for_code_generation}'.
-
-                   Given the scraped WEBSITE_CONTENT content below, generate working code to showcase how to run the code.
+    feedback_for_code_generation = await human_in_the_loop.open_editor_async()
 
-                   Focus on the code. Use detailed variable and function names. Comment every line of code explaining what it does.
-                   Remember, this is code to showcase how the code works. It should be fully functional and runnable.
-                   Respond in this JSON format exclusively: {{code: ''}}
-
-                   WEBSITE_CONTENT:
-                     {scraped_markdown}
-                """),
-        pydantic_model=ExampleCodeResponse,
+    # Acknowledge the request while the scrape and first draft are in flight
+    speak_task = asyncio.create_task(
+        speak_feedback_async(
+            f"Okay got it, I see you want to focus on '{feedback_for_code_generation}'. I'll generate the code for you now.",
+            cache=False,
+        )
     )
 
-    print("👧 Raw response: v1\n\n", example_code_response_1.code)
+    try:
+        scraped_markdown = await scrape_task
 
-    example_code_response_2 = llm.gpt4t_w_vision_json_prompt(
-        dedent(f"""You are an elite level, principle software engineer.
+        example_code_response_1: ExampleCodeResponse = await llm.gpro_1_5_prompt_with_model_async(
+            dedent(f"""You're a professional software developer advocate that takes pride in writing good code.
+                       You take documentation, and convert it into runnable code.
 
-                   You work with a co-engineer that likes to leave non-runnable code in the code so you're responsible for making sure it's runnable.
-                   You've just generated the first draft EXAMPLE_CODE below.
+                       You have a new request to generate code for the following url: '{url_from_clipboard}' with a focus on '{feedback_for_code_generation}'.
 
-                   You're now taking a second pass to clean it up to make sure it meets the REQUIREMENTS
+                       Given the scraped WEBSITE_CONTENT content below, generate working code to showcase how to run the code.
 
-                   REQUIREMENTS:
-                      - Make sure it's immediately runnable and functional.
-                      - Removing anything that isn't runnable code.
-                      - This code will be immediately placed into a file and run.
-                      - The code should be well commented so it's easy to understand.
-                      - The code should be well formatted so it's easy to read.
-                      - The code should use verbose variable and function names.
-                      - You pay close attention to indentation.
-                      - Respond in JSON format with the following keys: {{code: ''}}
-
-                   EXAMPLE_CODE:
-                     {example_code_response_1.code}
-                """),
-        pydantic_model=ExampleCodeResponse,
-    )
+                       Focus on the code. Use detailed variable and function names. Comment every line of code explaining what it does.
+                       Remember, this is code to showcase how the code works. It should be fully functional and runnable.
+                       Respond in this JSON format exclusively: {{code: ''}}
 
-    print("👧 Raw response: v2\n\n", example_code_response_2.code)
+                       WEBSITE_CONTENT:
+                         {scraped_markdown}
+                    """),
+            pydantic_model=ExampleCodeResponse,
+        )
 
-    example_code_response_3 = llm.gpt4t_w_vision_json_prompt(
-        dedent(f"""You are a top-level programmer and super-expert in software engineering.
+        print("👧 Raw response: v1\n\n", example_code_response_1.code)
 
-                   You've received a near final draft of code to finalize.
-                   You work with a co-engineer that likes to leave non-runnable code in the code so you're responsible for making sure it's runnable.
-                   You're taking a final pass to make sure the code is near perfect and fully runnable.
-                   You follow the REQUIREMENTS below to make sure the code is top notch for production deployment.
+        final_code_prompt = dedent(f"""You are a top-level programmer and super-expert in software engineering.
 
-                   REQUIREMENTS:
-                      - Make sure the code is immediately runnable and functional.
-                      - Removing anything that isn't runnable code.
-                      - This code will be immediately placed into a file and run.
-                      - The code follows expert coding best practices.
-                      - The code should be well commented so it's easy to understand.
-                      - The code should be well formatted so it's easy to read.
-                      - The code should use verbose variable and function names.
-                      - You pay close attention to indentation.
-                      - Respond in JSON format with the following keys: {{code: ''}}
-
-                   EXAMPLE_CODE:
-                      {example_code_response_2.code}
-                """),
-        pydantic_model=ExampleCodeResponse,
-    )
+                       You work with a co-engineer that likes to leave non-runnable code in the code so you're responsible for making sure it's runnable.
+                       You've received the first draft EXAMPLE_CODE below to finalize.
+                       First silently critique the draft for anything that isn't runnable or doesn't meet the REQUIREMENTS,
+                       then emit only the final, fully runnable version of the code.
 
-    print("👧 Raw response: v3\n\n", example_code_response_3.code)
+                       REQUIREMENTS:
+                          - Make sure the code is immediately runnable and functional.
+                          - Removing anything that isn't runnable code.
+                          - This code will be immediately placed into a file and run.
+                          - The code follows expert coding best practices.
+                          - The code should be well commented so it's easy to understand.
+                          - The code should be well formatted so it's easy to read.
+                          - The code should use verbose variable and function names.
+                          - You pay close attention to indentation.
+                          - Respond in JSON format with the following keys: {{code: ''}}
 
-    example_code_file_prompt = dedent(f"""{PERSONAL_AI_ASSISTANT_PROMPT_HEAD}
+                       EXAMPLE_CODE:
+                          {example_code_response_1.code}
+                    """)
 
-                  You've just generated the following CODE below for your human companion.
-                  Create a file name for the code file that will be written to the following directory: {configuration['working_directory']}
-                  The file name should be unique and descriptive of the code it contains.
-                  Respond exclusively with the file name in the following JSON format: {{file_name: ''}}.
+        # Naming only depends on the draft, so it runs alongside the final pass
+        example_code_file_prompt = EXAMPLE_CODE_FILE_NAME_PROMPT_TEMPLATE.format(
+            assistant_name=PERSONAL_AI_ASSISTANT_NAME,
+            companion_name=HUMAN_COMPANION_NAME,
+            working_directory=configuration["working_directory"],
+            code=example_code_response_1.code,
+        )
 
-                  CODE:
-                    {example_code_response_3.code}
-               """)
+        example_code_response_2, example_code_file_name_response = await asyncio.gather(
+            llm.gpt4t_w_vision_json_prompt_async(
+                final_code_prompt,
+                pydantic_model=ExampleCodeResponse,
+            ),
+            llm.gpt4t_w_vision_json_prompt_async(
+                example_code_file_prompt,
+                pydantic_model=FileNameResponse,
+            ),
+        )
+    except BaseException:
+        # Stop the acknowledgement so it is never left unobserved, the workflow error is what gets raised
+        speak_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError, Exception):
+            await speak_task
+        raise
 
-    example_code_file_name_response = llm.gpt4t_w_vision_json_prompt(
-        example_code_file_prompt,
-        pydantic_model=ExampleCodeFileNameResponse,
-    )
+    print("👧 Raw response: v2\n\n", example_code_response_2.code)
 
     new_file_name = example_code_file_name_response.file_name
 
@@ -611,14 +772,14 @@ def example_code_workflow(prompt: str):
 
     # write the code to the file
     with open(new_file_path, "w") as file:
-        file.write(example_code_response_3.code)
+        file.write(example_code_response_2.code)
 
     print(f"✅ Code example written to {new_file_path}")
 
-    speak(
-        build_feedback_prompt(
-            f"Code has been written to the working directory into a file named {new_file_name}. Let me know if you need anything else."
-        )
+    await speak_task
+    await speak_feedback_async(
+        f"Code has been written to the working directory into a file named {new_file_name}. Let me know if you need anything else.",
+        cache=False,
     )
 
     pass
@@ -627,80 +788,193 @@ def example_code_workflow(prompt: str):
 # --------------------- Helper Methods ---------------------
 
 
+def run_async(coroutine):
+    """
+    Run a coroutine to completion on the shared event loop.
+
+    The async LLM clients keep connections bound to the loop they were first used on,
+    so every workflow runs on the same loop instead of a fresh asyncio.run() loop.
+    """
+    return _EVENT_LOOP.run_until_complete(coroutine)
+
+
 def human_file_json_prompt(contents: dict):
     """
     Prompt the user to edit the file
     """
-    edited_contents = editor.edit(contents=json.dumps(contents, indent=2))
-    edited_config = json.loads(edited_contents.decode())
+    edited_contents = editor.edit(
+        contents=orjson.dumps(contents, option=orjson.OPT_INDENT_2)
+    )
+    edited_config = orjson.loads(edited_contents)
 
     return edited_config
 
 
-def scrape_to_markdown(url):
-    # Send a GET request to the URL
-    response = requests.get(url)
+def html_to_markdown(html: bytes) -> str:
+    # Parse the raw HTML bytes with the C-backed selectolax parser
+    tree = LexborHTMLParser(html)
 
-    # Create a BeautifulSoup object to parse the HTML content
-    soup = BeautifulSoup(response.content, "html.parser")
+    # Drop scripts and styles in place so they never reach markdownify
+    for node in tree.css("script, style"):
+        node.decompose()
 
     # Convert the parsed HTML to Markdown using markdownify
-    markdown = markdownify(str(soup), strip=["script", "style"])
+    root = tree.body or tree.root
+    return markdownify(root.html) if root else ""
+
+
+def scrape_to_markdown(url):
+    """
+    Scrape the URL to markdown, revalidating previously scraped pages with ETag/Last-Modified.
+    """
+    cached = _SCRAPE_CACHE.get(url)
+
+    # Send a (conditional) GET request to the URL
+    headers = {}
+    if cached:
+        if cached["etag"]:
+            headers["If-None-Match"] = cached["etag"]
+        if cached["last_modified"]:
+            headers["If-Modified-Since"] = cached["last_modified"]
+    response = _HTTP.get(url, headers=headers)
+
+    # Unchanged since the last scrape, skip parsing entirely
+    if cached and response.status_code == 304:
+        print(f"⚡ Page unchanged, using cached markdown for {url}")
+        return cached["markdown"]
+
+    markdown = html_to_markdown(response.content)
+
+    if response.ok:
+        _SCRAPE_CACHE.set(
+            url,
+            {
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+                "markdown": markdown,
+            },
+        )
 
     return markdown
 
 
-def build_feedback_prompt(message: str):
+def feedback_prompt_stream(message: str, cache: bool = True):
     """
-    Build a prompt using the existing prompt format and ask our assistant to respond given the 'message'
+    Build a prompt using the existing prompt format and stream our assistant's response given the 'message'
     """
-    prompt = dedent(f"""{PERSONAL_AI_ASSISTANT_PROMPT_HEAD}
-                        Concisely communicate the following message to your human companion: '{message}'
-                     """)
+    prompt = FEEDBACK_PROMPT_TEMPLATE.format(message=message)
 
-    response = llm.gpro_1_5_prompt(prompt)
+    chunks = []
+    for chunk in llm.gpro_1_5_prompt_stream(
+        prompt, system_instruction=PERSONAL_AI_ASSISTANT_SYSTEM_PROMPT
+    ):
+        chunks.append(chunk)
+        yield chunk
 
-    return response
+    if cache:
+        feedback_cache.put(message, "".join(chunks))
 
 
 # --------------------- AUDIO I/O ---------------------
 
 
-def speak(text: str):
-    client = ElevenLabs(
-        api_key=os.getenv("ELEVENLABS_API_KEY"),  # Defaults to ELEVEN_API_KEY from .env
+def synthesize_speech_stream(text: str):
+    """Start streaming synthesis of the text, yielding audio chunks as they arrive."""
+    return _EL_CLIENT.text_to_speech.convert_as_stream(
+        voice_id=ELEVENLABS_VOICE_ID,
+        text=text,
+        model_id="eleven_turbo_v2",
+        # model_id="eleven_multilingual_v2",
+        optimize_streaming_latency="3",
     )
 
-    # text=text, voice="WejK3H1m7MI9CHnIjW9K",
-    audio = client.generate(
-        text=text,
-        voice=ELEVENLABS_VOICE_ID,
-        model="eleven_turbo_v2",
-        # model="eleven_multilingual_v2",
+
+def split_sentences(text: str):
+    """Split text into sentences on '.', '!' and '?' boundaries."""
+    return [sentence for sentence in SENTENCE_BOUNDARY.split(text.strip()) if sentence]
+
+
+def synthesize_speech(text: str) -> bytes:
+    """Synthesize the text and return the complete audio."""
+    return b"".join(synthesize_speech_stream(text))
+
+
+def speak(text: str):
+    """
+    Speak the text, streaming the first sentence while the rest are synthesized in parallel.
+    """
+    sentences = split_sentences(text)
+    if not sentences:
+        return
+
+    # Later sentences are synthesized a few at a time and played back in order
+    with ThreadPoolExecutor(max_workers=TTS_MAX_PARALLEL_SENTENCES) as executor:
+        remaining_audio = [
+            executor.submit(synthesize_speech, sentence) for sentence in sentences[1:]
+        ]
+
+        stream(synthesize_speech_stream(sentences[0]))
+
+        for audio in remaining_audio:
+            play(audio.result())
+
+
+def speak_stream(text_chunks: Iterator[str]):
+    """
+    Speak text as it is generated, feeding the chunks to ElevenLabs' WebSocket input stream.
+    """
+    stream(
+        _EL_CLIENT.text_to_speech.convert_realtime(
+            voice_id=ELEVENLABS_VOICE_ID,
+            text=text_chunks,
+            model_id="eleven_turbo_v2",
+        )
     )
 
-    play(audio)
 
+def speak_feedback(message: str, cache: bool = True):
+    """
+    Speak our assistant's response to the 'message', reusing the response to a similar cached message.
+
+    Pass cache=False for messages that interpolate file names or user input, a similar
+    cached message would answer with the wrong details.
+    """
+    if cache:
+        cached_response = feedback_cache.get(message)
+        if cached_response is not None:
+            speak(cached_response)
+            return
+
+    speak_stream(feedback_prompt_stream(message, cache=cache))
 
-def transcribe_audio_file(file_path):
-    try:
-        # STEP 1 Create a Deepgram client using the API key
-        api_key = os.getenv("DEEPGRAM_API_KEY")
-        dg_client = DeepgramClient(api_key)
 
-        # STEP 2 Read the recorded audio file
-        with open(file_path, "rb") as file:
-            buffer_data = file.read()
+async def speak_feedback_async(message: str, cache: bool = True):
+    await asyncio.to_thread(speak_feedback, message, cache)
 
-        # STEP 2: Configure Deepgram options for audio analysis
-        payload: FileSource = {"buffer": buffer_data}
-        options = PrerecordedOptions(model="nova-2", smart_format=True)
 
-        # STEP 3: Call the transcribe_file method with the text payload and options
-        response = dg_client.listen.prerecorded.v("1").transcribe_file(payload, options)
+def transcribe_pcm(recording: np.ndarray):
+    """Transcribe a 16-bit mono PCM recording with Deepgram, without writing it to disk."""
+    try:
+        # STEP 1: Get the raw little-endian PCM bytes (no copy beyond tobytes() for int16 input)
+        pcm = np.ascontiguousarray(recording, dtype="<i2").tobytes()
+
+        # STEP 2: Configure Deepgram options for the raw (headerless) audio buffer
+        payload: FileSource = {"buffer": pcm}
+        options = PrerecordedOptions(
+            model="nova-2",
+            encoding="linear16",
+            sample_rate=SAMPLE_RATE,
+            channels=CHANNELS,
+            # Transcripts are keyword-routed and prompted on, formatting isn't needed
+            smart_format=False,
+            punctuate=False,
+        )
+
+        # STEP 3: Call the transcribe_file method with the audio payload and options
+        response = _DG_CLIENT.listen.rest.v("1").transcribe_file(payload, options)
 
-        # STEP 4: Await the response and extract the transcript
-        transcript = response["results"]["channels"][0]["alternatives"][0]["transcript"]
+        # STEP 4: Read the transcript straight from the SDK response object
+        transcript = response.results.channels[0].alternatives[0].transcript
 
         return transcript
 
@@ -718,78 +992,143 @@ def track_interaction_time():
         ITERATION_START_TIME = None
 
 
-def record_audio(duration=10, fs=44100):
-    """Record audio from the microphone."""
-    track_interaction_time()
+def wait_for_wake_word(audio_stream):
+    """Block until the local wake word model hears the activation keyword on the stream."""
+    print("👂 Waiting for wake word...")
+    _WAKE_WORD_MODEL.reset()
+    while True:
+        data, _ = audio_stream.read(WAKE_WORD_FRAME_SAMPLES)
+        scores = _WAKE_WORD_MODEL.predict(data[:, 0])
+        if max(scores.values()) > WAKE_WORD_THRESHOLD:
+            print("✅ Wake word detected!")
+            return
+
+
+def record_audio_vad(audio_stream, max_duration=10):
+    """
+    Record a single utterance from the audio stream.
+
+    Frames are gated with WebRTC VAD: leading silence is skipped and the chunk closes after
+    VAD_SILENCE_FRAMES of trailing silence (or after max_duration seconds of audio).
+    Returns None if no speech starts within VAD_MAX_LEADING_SILENCE_FRAMES.
+    """
+    max_frames = int(max_duration * SAMPLE_RATE / VAD_FRAME_SAMPLES)
+    pre_roll = deque(maxlen=VAD_PRE_ROLL_FRAMES)
+    frames = []
+    silent_frames = 0
+    leading_frames = 0
+    while len(frames) < max_frames:
+        frame, _ = audio_stream.read(VAD_FRAME_SAMPLES)
+        is_speech = _VAD.is_speech(frame.tobytes(), SAMPLE_RATE)
+        if not frames:
+            # Keep a little audio before the first speech frame so the onset isn't cut
+            pre_roll.append(frame)
+            if is_speech:
+                print("🔴 Recording...")
+                frames.extend(pre_roll)
+                continue
+            leading_frames += 1
+            if leading_frames >= VAD_MAX_LEADING_SILENCE_FRAMES:
+                print("🔇 No speech after the wake word.")
+                return None
+            continue
+        frames.append(frame)
+        silent_frames = 0 if is_speech else silent_frames + 1
+        if silent_frames >= VAD_SILENCE_FRAMES:
+            break
 
-    print("🔴 Recording...")
-    recording = sd.rec(
-        int(duration * fs), samplerate=fs, channels=CHANNELS, dtype="int16"
-    )
-    sd.wait()
     print("🎧 Recording Chunk Complete")
-    global ITERATION_START_TIME
-    ITERATION_START_TIME = datetime.now()
-    return recording
+    return np.concatenate(frames)
 
 
-def save_audio_file(recording, fs=44100, filename="output.wav"):
-    """Save the recorded audio to a file."""
-    with wave.open(filename, "wb") as wf:
-        wf.setnchannels(CHANNELS)
-        wf.setsampwidth(2)
-        wf.setframerate(fs)
-        wf.writeframes(recording)
+def record_audio_chunks(chunk_queue: queue.Queue, max_duration=10):
+    """
+    Continuously wait for the wake word and record the following utterance onto the queue
+    (runs on a background thread).
 
+    The input stream is opened once and stays open for the life of the process, wake word
+    and VAD frames are both read from its buffer.
+    """
+    with sd.InputStream(
+        samplerate=SAMPLE_RATE,
+        blocksize=WAKE_WORD_FRAME_SAMPLES,
+        dtype="int16",
+        channels=CHANNELS,
+        # Keep the OS-side capture buffer small so frames reach the models promptly
+        latency="low",
+    ) as audio_stream:
+        while True:
+            wait_for_wake_word(audio_stream)
+            recording = record_audio_vad(audio_stream, max_duration=max_duration)
+            if recording is not None:
+                chunk_queue.put(recording)
+
+
+def personal_ai_assistant_loop(audio_chunk_size=10, on_keywords=None):
+    # Record the next chunk while the current one is transcribed and handled
+    chunk_queue = queue.Queue(maxsize=2)
+    threading.Thread(
+        target=record_audio_chunks,
+        args=(chunk_queue, audio_chunk_size),
+        daemon=True,
+    ).start()
 
-def personal_ai_assistant_loop(
-    audio_chunk_size=10, activation_keyword=ACTIVATION_KEYWORD, on_keywords=None
-):
+    global ITERATION_START_TIME
     while True:
-        recording = record_audio(duration=audio_chunk_size)
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"audio_{timestamp}.wav"
-        save_audio_file(recording, filename=filename)
-        file_size = os.path.getsize(filename)
-        print(f"📁 File {filename} has been saved with a size of {file_size} bytes.")
-        transcript = transcribe_audio_file(filename)
+        recording = chunk_queue.get()
+        ITERATION_START_TIME = datetime.now()
+        print(f"🎙️ Recorded {recording.nbytes} bytes of audio.")
+        transcript = transcribe_pcm(recording)
         print("📝 transcript was:", transcript)
-        if activation_keyword.lower() in transcript.lower():
-            if on_keywords:
-                on_keywords(transcript)
-        os.remove(filename)
+        # The wake word already activated us, so every transcript is a command
+        if transcript and on_keywords:
+            on_keywords(transcript)
+        track_interaction_time()
 
 
-def text_after_keyword(transcript: str, keyword: str):
-    """Extract and return the text that comes after a specified keyword in the transcript."""
-    try:
-        # Find the position of the keyword in the transcript
-        keyword_position = transcript.lower().find(keyword.lower())
-        if keyword_position == -1:
-            # If the keyword is not found, return an empty string
-            return ""
-        # Extract the text after the keyword
-        text_after = transcript[keyword_position + len(keyword) :].strip()
-        return text_after
-    except Exception as e:
-        print(f"Error extracting text after keyword: {e}")
-        return ""
+# Only a leading, whole-word keyword is the activation, "adapter" or "Canada" are left alone
+_ACTIVATION_KEYWORD_RE = re.compile(
+    rf"^\s*{re.escape(ACTIVATION_KEYWORD)}\b[\s,.!?]*", re.IGNORECASE
+)
+
+
+def strip_activation_keyword(transcript: str):
+    """Return the transcript without a leading activation keyword."""
+    return _ACTIVATION_KEYWORD_RE.sub("", transcript, count=1)
+
+
+# Flatten the router once so a single regex scan finds the keywords and their agents,
+# the router's order is kept as the priority (greetings are the catch-all)
+_KEYWORD_AGENTS = {
+    keyword: agent
+    for keyword_group, agent in get_simple_keyword_ai_agent_router().items()
+    for keyword in keyword_group.split(",")
+}
+_KEYWORD_PRIORITY = {keyword: rank for rank, keyword in enumerate(_KEYWORD_AGENTS)}
+# Keywords only need to start a word, so "questions" or "configured" still match
+_KEYWORD_RE = re.compile(
+    r"\b(?:"
+    + "|".join(
+        re.escape(keyword) for keyword in sorted(_KEYWORD_AGENTS, key=len, reverse=True)
+    )
+    + r")",
+    re.IGNORECASE,
+)
 
 
 def get_first_keyword_in_prompt(prompt: str):
-    map_keywords_to_agents = get_simple_keyword_ai_agent_router()
-    for keyword_group, agent in map_keywords_to_agents.items():
-        keywords = keyword_group.split(",")
-        for keyword in keywords:
-            if keyword in prompt.lower():
-                return agent, keyword
-    return None, None
+    keywords = {match.group(0).lower() for match in _KEYWORD_RE.finditer(prompt)}
+    if not keywords:
+        return None, None
+    keyword = min(keywords, key=_KEYWORD_PRIORITY.__getitem__)
+    return _KEYWORD_AGENTS[keyword], keyword
 
 
 def on_activation_keyword_detected(transcript: str):
     print("✅ Activation keyword detected!, transcript is: ", transcript)
 
-    prompt = text_after_keyword(transcript, ACTIVATION_KEYWORD)
+    # The keyword is usually consumed by the wake word detector, but strip it if it was transcribed
+    prompt = strip_activation_keyword(transcript)
 
     print("🔍 prompt is: ", prompt)
 
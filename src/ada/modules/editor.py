@@ -7,13 +7,14 @@ ADA AI Assistant workflow.
 
 The primary function, `edit()`, allows for opening a temporary file with given content
 in TextEdit, waiting for the user to make edits, and then returning the modified content.
+`edit_async()` does the same without blocking the asyncio event loop.
 
 Key Features:
-1. Creates a temporary file with a random name to avoid conflicts.
+1. Creates a private temporary file with a unique name to avoid conflicts.
 2. Opens the default text editor (TextEdit) with the temporary file.
 3. Waits for the user to close the editor before proceeding.
 4. Reads and returns the modified content from the temporary file.
-5. Cleans up by removing the temporary file after use.
+5. Always cleans up by removing the temporary file after use.
 
 Usage:
     from modules import editor
@@ -23,62 +24,82 @@ Usage:
 
 Note:
 - This module is designed specifically for macOS and uses the 'open' command to launch TextEdit.
-- The temporary file is created in the current working directory with read-write permissions for all users.
-- A 1-second delay is introduced before opening the file to ensure it's fully written to disk.
+- The temporary file is created in the system temp directory, readable and writable by the current user only.
+- The file is written with a single write() and not fsync'ed, it never needs to survive a crash.
 
 Dependencies:
-- subprocess: For running system commands to open TextEdit.
-- os: For file and directory operations.
-- random: For generating random numbers for unique filenames.
-- time: For introducing a delay before opening the editor.
+- subprocess, asyncio: For running system commands to open TextEdit.
+- os: For file operations.
+- tempfile: For creating uniquely named temporary files.
 
 This module is part of the ADA AI Assistant project and is typically used in workflows
 that require human intervention or editing of AI-generated content.
 """
 
+import asyncio
 import os
-import random
 import subprocess
-import time
+import tempfile
 
+TEXTEDIT_COMMAND = ["open", "-W", "-n", "-a", "TextEdit"]
 
-def edit(contents: str):
+
+def _create_temp_file(contents: str | bytes) -> str:
+    """Write the contents to a new private temporary file and return its path."""
+    # Create a private (0600) temporary file with a unique name in the system temp directory
+    fd, temp_file_path = tempfile.mkstemp(suffix=".json", prefix="ada-edit-")
+
+    # Write the contents and close the file explicitly (bytes are written as-is). No fsync:
+    # the buffer is disposable and write() already makes it visible to the editor through
+    # the page cache, forcing it to disk would only add latency.
+    try:
+        os.write(fd, contents if isinstance(contents, bytes) else contents.encode())
+    finally:
+        os.close(fd)
+
+    return temp_file_path
+
+
+def _read_temp_file(temp_file_path: str) -> str:
+    """Read the modified content back from the temporary file."""
+    with open(temp_file_path, "r") as file:
+        return file.read()
+
+
+def edit(contents: str | bytes):
     """
     Opens TextEdit on macOS and waits until it is closed to proceed.
     """
-    # Get the current working directory
-    current_dir = os.getcwd()
-    # Generate a random number to include in the filename
-    random_number = random.randint(1000, 9999)
-    temp_file_path = os.path.join(current_dir, f"tempfile_{random_number}.json")
+    temp_file_path = _create_temp_file(contents)
 
-    # Create and close the temporary file explicitly
-    with open(temp_file_path, "w+") as tmp:
-        tmp.write(contents)
-        tmp.flush()
+    try:
+        # Open the default text editor and wait for it to close (a blocking waitpid, no polling)
+        editor_process = subprocess.Popen([*TEXTEDIT_COMMAND, temp_file_path])
+        editor_process.wait()
 
-    # Change the file permissions to make it readable and writable by everyone
-    os.chmod(temp_file_path, 0o666)
+        return _read_temp_file(temp_file_path)
 
-    # Introduce a delay
-    time.sleep(1)  # Wait for 1 second before opening the file in Editor
+    finally:
+        # Clean up by removing the temporary file, even if the editor failed
+        os.unlink(temp_file_path)
 
-    # Open the default text editor and wait for it to close
-    editor_process = subprocess.Popen(
-        ["open", "-W", "-n", "-a", "TextEdit", temp_file_path]
-    )
 
-    # Wait for the TextEdit process to close
-    editor_process.wait()
+async def edit_async(contents: str | bytes):
+    """
+    Async variant of edit, the event loop keeps running while the user edits.
+    """
+    temp_file_path = _create_temp_file(contents)
 
-    # Read the modified content from the file
-    with open(temp_file_path, "r") as file:
-        modified_content = file.read()
+    try:
+        editor_process = await asyncio.create_subprocess_exec(
+            *TEXTEDIT_COMMAND, temp_file_path
+        )
+        await editor_process.wait()
 
-    # Clean up by removing the temporary file
-    os.remove(temp_file_path)
+        return _read_temp_file(temp_file_path)
 
-    return modified_content
+    finally:
+        os.unlink(temp_file_path)
 
 
 # Example usage:
@@ -6,7 +6,8 @@ ADA AI Assistant workflow. It offers methods for opening files, editing content,
 and interacting with the system's default text editor.
 
 Key Components:
-1. File Selection: Allows users to choose files through a graphical interface.
+1. File Selection: Allows users to choose files through a graphical interface
+   (a single hidden Tk root is created lazily and reused).
 2. Text Editing: Enables opening the system's default text editor for content modification.
 3. File Handling: Manages opening files in the default editor for further editing.
 
@@ -14,6 +15,7 @@ Main Functions:
 - open_file(): Opens a file selection dialog and returns the selected file path.
 - open_editor(): Opens the default text editor with empty content for user input.
 - open_file_in_editor_and_continue(file): Opens a specified file in the default editor.
+- open_editor_async(): Awaitable variant of open_editor() for async workflows.
 
 Usage:
     from modules import human_in_the_loop
@@ -29,7 +31,7 @@ Usage:
 
 Dependencies:
 - tkinter: For creating the file selection dialog.
-- subprocess: For running system commands to open the text editor.
+- os, shutil: For launching the 'code' CLI to open files in the editor.
 - modules.editor: Custom module for text editor integration.
 
 Note:
@@ -43,31 +45,48 @@ for macOS). For other operating systems, modifications may be necessary to ensur
 compatibility with the appropriate text editor.
 """
 
-import subprocess
+import os
+import shutil
 import tkinter as tk
 from tkinter import filedialog
 
 from ada.modules import editor
 
+# Resolved once, instead of a PATH lookup on every launch
+CODE_PATH = shutil.which("code")
+
+_tk_root = None
+
 
 def open_file() -> str:
     """Opens a file selection dialog and returns the selected file path."""
-    root = tk.Tk()
-    root.withdraw()  # Hide the main window
-    file_path = filedialog.askopenfile()
+    # Tk is started once on first use, later dialogs reuse the hidden root window
+    global _tk_root
+    if _tk_root is None:
+        _tk_root = tk.Tk()
+        _tk_root.withdraw()  # Hide the main window
+    # askopenfilename only returns the path, an empty string means the dialog was cancelled
+    file_path = filedialog.askopenfilename(parent=_tk_root)
     if not file_path:
         return None
-    root.destroy()
-    return file_path.name
+    return file_path
 
 
 def open_editor() -> str:
     return editor.edit(contents="")
 
 
+async def open_editor_async() -> str:
+    return await editor.edit_async(contents="")
+
+
 def open_file_in_editor_and_continue(file: str) -> None:
     """Opens a file in the editor using the 'code' command and allows the user to continue editing."""
-    if file:
-        subprocess.run(["code", file])
-    else:
+    if not file:
         print("No file provided to open.")
+    elif not CODE_PATH:
+        print("The 'code' command was not found on the PATH.")
+    else:
+        # posix_spawn skips forking this (large) process, the CLI just hands the file to VS Code
+        pid = os.posix_spawn(CODE_PATH, [CODE_PATH, file], os.environ)
+        os.waitpid(pid, 0)
@@ -10,10 +10,11 @@ Key Features:
 1. Integration with multiple AI services:
    - Google's Generative AI (Gemini 1.5)
    - OpenAI's GPT-4 and GPT-4 Vision
-2. Support for text-only and multimodal (text + image) prompts
+2. Support for text-only and multimodal (text + image) prompts, with optional Gemini system instructions
 3. Structured output parsing using Pydantic models
-4. Image encoding for vision-based AI models
+4. Chunked image encoding for vision-based AI models
 5. Environment variable management for API keys
+6. Persistent caching of text prompt responses (see llm_cache)
 
 Main Functions:
 - gpro_1_5_prompt: Generate text using Google's Gemini 1.5 Pro model
@@ -21,16 +22,21 @@ Main Functions:
 - gpt4t_w_vision_json_prompt: Generate JSON-structured responses using GPT-4 Turbo
 - gpt4t_w_vision: Generate free-form text responses using GPT-4 Turbo
 - gpt4t_w_vision_image_with_model: Analyze images and generate structured responses using GPT-4 Vision
+- *_async: Awaitable variants of the Gemini and GPT-4 JSON prompts for concurrent workflows
+- gpro_1_5_prompt_stream: Yield Gemini 1.5 Pro text chunks as they are generated
 
 Utility Functions:
-- encode_image: Convert image files to base64 encoded strings for API requests
+- image_data_url: Convert image files to base64 data URLs for API requests, encoding in chunks
 
 Dependencies:
 - google.generativeai: For interacting with Google's Generative AI models
 - openai: For interacting with OpenAI's models
+- httpx: For the shared HTTP/2 connection pools of the OpenAI clients
 - pydantic: For data validation and settings management
 - dotenv: For loading environment variables
 - base64: For encoding images
+- logging: For debug output of raw responses, silent unless DEBUG logging is enabled
+- ada.modules.llm_cache: For caching responses on disk
 
 Usage:
     from modules import llm
@@ -58,14 +64,21 @@ as needed for the ADA AI Assistant project.
 """
 
 import base64
+import logging
 import os
+from functools import lru_cache
+from typing import Iterator
 
 import google.generativeai as genai
+import httpx
 import openai
 from dotenv import load_dotenv
 from pydantic import BaseModel
 
 from ada.modules import parsers
+from ada.modules.llm_cache import cached_llm
+
+logger = logging.getLogger(__name__)
 
 # Load environment variables from .env file
 load_dotenv()
@@ -81,28 +94,90 @@ if OPENAI_API_KEY is None:
 #
 
 genai.configure(api_key=GOOGLE_GENAI_API_KEY)
-openai.api_key = OPENAI_API_KEY
+
+# One client per mode for the whole process, so connections (HTTP/2) are kept alive between calls
+OPENAI_TIMEOUT = httpx.Timeout(60.0, connect=5.0)
+OPENAI_LIMITS = httpx.Limits(max_keepalive_connections=8)
+_openai = openai.OpenAI(
+    api_key=OPENAI_API_KEY,
+    http_client=httpx.Client(http2=True, timeout=OPENAI_TIMEOUT, limits=OPENAI_LIMITS),
+)
+_async_openai = openai.AsyncOpenAI(
+    api_key=OPENAI_API_KEY,
+    http_client=httpx.AsyncClient(
+        http2=True, timeout=OPENAI_TIMEOUT, limits=OPENAI_LIMITS
+    ),
+)
+
+IMAGE_ENCODE_CHUNK_SIZE = 3 * 256 * 1024
 
 #
 
 
-def gpro_1_5_prompt(prompt) -> str:
+def _chat_messages(instructions: str, prompt: str, image_url: str = None) -> list:
+    """Build the system + user chat messages, optionally attaching an image."""
+    content = prompt
+    if image_url:
+        content = [
+            {"type": "text", "text": prompt},
+            {"type": "image_url", "image_url": {"url": image_url}},
+        ]
+    return [
+        {"role": "system", "content": instructions},
+        {"role": "user", "content": content},
+    ]
+
+
+def _validate_gemini_json(response_text: str, pydantic_model: BaseModel) -> BaseModel:
+    """Validate a Gemini response, which is either plain JSON or a fenced ```json block."""
+    stripped = response_text.lstrip()
+    # A fence, when present, opens the response, so only its start needs checking
+    if stripped.startswith("```"):
+        return pydantic_model.model_validate(parsers.parse_json_from_gemini(stripped))
+    return pydantic_model.model_validate_json(stripped)
+
+
+@lru_cache(maxsize=8)
+def _get_genai_model(
+    model_name: str, system_instruction: str = None
+) -> genai.GenerativeModel:
+    """Build a Gemini model once per name and system instruction and reuse it across prompts."""
+    return genai.GenerativeModel(
+        model_name=model_name, system_instruction=system_instruction
+    )
+
+
+@cached_llm
+def gpro_1_5_prompt(prompt, system_instruction: str = None) -> str:
     """
     Generates content based on the provided prompt using the Gemini 1.5 API model and returns the text part of the first candidate's content.
 
     Args:
     - prompt (str): The prompt to generate content for.
+    - system_instruction (str, optional): A static system instruction sent ahead of the prompt.
 
     Returns:
     - str: The text part of the first candidate's content from the generated response.
     """
     model_name = "models/gemini-1.5-pro-latest"
-    gen_config = genai.GenerationConfig()
-    model = genai.GenerativeModel(model_name=model_name)
+    model = _get_genai_model(model_name, system_instruction)
     response = model.generate_content(prompt, request_options={})
     return response.candidates[0].content.parts[0].text
 
 
+@cached_llm
+def gpro_1_5_prompt_stream(prompt, system_instruction: str = None) -> Iterator[str]:
+    """
+    Streaming variant of gpro_1_5_prompt, yields text chunks as Gemini generates them.
+    """
+    model_name = "models/gemini-1.5-pro-latest"
+    model = _get_genai_model(model_name, system_instruction)
+    response = model.generate_content(prompt, stream=True, request_options={})
+    for chunk in response:
+        yield chunk.text
+
+
+@cached_llm
 def gpro_1_5_prompt_with_model(prompt, pydantic_model: BaseModel) -> BaseModel:
     """
     Generates content based on the provided prompt using the Gemini 1.5 API model and returns the text part of the first candidate's content.
@@ -114,73 +189,97 @@ def gpro_1_5_prompt_with_model(prompt, pydantic_model: BaseModel) -> BaseModel:
     - str: The text part of the first candidate's content from the generated response.
     """
     model_name = "models/gemini-1.5-pro-latest"
-    gen_config = genai.GenerationConfig()
-    model = genai.GenerativeModel(model_name=model_name)
+    model = _get_genai_model(model_name)
     response = model.generate_content(prompt, request_options={})
-    response_text = response.candidates[0].content.parts[0].text
-    if "```json" in response_text:
-        return pydantic_model.model_validate(
-            parsers.parse_json_from_gemini(response_text)
-        )
-    else:
-        return pydantic_model.model_validate_json(response_text)
+    return _validate_gemini_json(
+        response.candidates[0].content.parts[0].text, pydantic_model
+    )
 
 
+@cached_llm
+async def gpro_1_5_prompt_with_model_async(
+    prompt, pydantic_model: BaseModel
+) -> BaseModel:
+    """
+    Async variant of gpro_1_5_prompt_with_model, so several prompts can be awaited concurrently.
+    """
+    model_name = "models/gemini-1.5-pro-latest"
+    model = _get_genai_model(model_name)
+    response = await model.generate_content_async(prompt, request_options={})
+    return _validate_gemini_json(
+        response.candidates[0].content.parts[0].text, pydantic_model
+    )
+
+
+@cached_llm
 def gpt4t_w_vision_json_prompt(
     prompt: str,
     model: str = "gpt-4-turbo-2024-04-09",
     instructions: str = "You are a helpful assistant that response in JSON format.",
     pydantic_model: BaseModel = None,
 ) -> str:
-    response = openai.chat.completions.create(
+    response = _openai.chat.completions.create(
+        model=model,
+        messages=_chat_messages(instructions, prompt),
+        response_format={"type": "json_object"},
+    )
+
+    response_text = response.choices[0].message.content
+    logger.debug("Text LLM response: %s", response_text)
+
+    as_model = pydantic_model.model_validate_json(response_text)
+
+    return as_model
+
+
+@cached_llm
+async def gpt4t_w_vision_json_prompt_async(
+    prompt: str,
+    model: str = "gpt-4-turbo-2024-04-09",
+    instructions: str = "You are a helpful assistant that response in JSON format.",
+    pydantic_model: BaseModel = None,
+) -> str:
+    """
+    Async variant of gpt4t_w_vision_json_prompt, so several prompts can be awaited concurrently.
+    """
+    response = await _async_openai.chat.completions.create(
         model=model,
-        messages=[
-            {
-                "role": "system",
-                "content": instructions,  # Added instructions as a system message
-            },
-            {
-                "role": "user",
-                "content": prompt,
-            },
-        ],
+        messages=_chat_messages(instructions, prompt),
         response_format={"type": "json_object"},
     )
 
     response_text = response.choices[0].message.content
-    print(f"Text LLM response: {response_text}")
+    logger.debug("Text LLM response: %s", response_text)
 
     as_model = pydantic_model.model_validate_json(response_text)
 
     return as_model
 
 
+@cached_llm
 def gpt4t_w_vision(
     prompt: str,
     model: str = "gpt-4-turbo-2024-04-09",
     instructions: str = "You are a helpful assistant.",
 ) -> str:
-    response = openai.chat.completions.create(
+    response = _openai.chat.completions.create(
         model=model,
-        messages=[
-            {
-                "role": "system",
-                "content": instructions,  # Added instructions as a system message
-            },
-            {
-                "role": "user",
-                "content": prompt,
-            },
-        ],
+        messages=_chat_messages(instructions, prompt),
     )
 
     response_text = response.choices[0].message.content
     return response_text
 
 
-def encode_image(image_path: str) -> str:
+def image_data_url(image_path: str) -> str:
+    """Build a base64 data URL for an image, encoding the file in chunks."""
+    file_extension = image_path.split(".")[-1]
+    data_url = bytearray(f"data:image/{file_extension};base64,".encode("ascii"))
     with open(image_path, "rb") as image_file:
-        return base64.b64encode(image_file.read()).decode("utf-8")
+        # Chunks are a multiple of 3 bytes, so they encode without padding in between
+        while chunk := image_file.read(IMAGE_ENCODE_CHUNK_SIZE):
+            data_url += base64.b64encode(chunk)
+    return data_url.decode("ascii")
 
 
 def gpt4t_w_vision_image_with_model(
@@ -190,43 +289,21 @@ def gpt4t_w_vision_image_with_model(
     instructions: str = "You are a helpful assistant that specializes in image analysis.",
     pydantic_model: BaseModel = None,
 ):
-    file_extension = file_path.split(".")[-1]
-
-    base64_image = encode_image(file_path)
+    image_url = image_data_url(file_path)
 
-    print("base64_image", base64_image)
+    logger.debug("Image data URL is %d characters", len(image_url))
 
-    response = openai.chat.completions.create(
+    response = _openai.chat.completions.create(
         model=model,
-        messages=[
-            {
-                "role": "system",
-                "content": instructions,
-            },
-            {
-                "role": "user",
-                "content": [
-                    {
-                        "type": "text",
-                        "text": prompt,
-                    },
-                    {
-                        "type": "image_url",
-                        "image_url": {
-                            "url": f"data:image/{file_extension};base64,{base64_image}"
-                        },
-                    },
-                ],
-            },
-        ],
+        messages=_chat_messages(instructions, prompt, image_url),
         response_format={"type": "json_object"},
     )
 
-    print("response", response)
+    logger.debug("response %s", response)
 
     response_text = response.choices[0].message.content
 
-    print("response_text", response_text)
+    logger.debug("response_text %s", response_text)
 
     parsed_response = pydantic_model.model_validate_json(response_text)
 
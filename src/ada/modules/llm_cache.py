@@ -0,0 +1,155 @@
+"""
+llm_cache.py - Persistent LLM Response Cache for ADA AI Assistant
+
+This module provides an exact-match, on-disk cache for LLM responses. Most of the
+wall time of an ADA turn is spent waiting on LLM round trips, and many prompts
+(feedback messages, clean-up passes, file naming) are repeated verbatim across
+turns. Caching them turns a multi-second network call into a local lookup.
+
+Key Features:
+1. Exact-match Keys: Entries are keyed on a sha256 of the model, the prompt and the
+   JSON schema of the Pydantic response model (if any).
+2. Persistence: Backed by a diskcache (SQLite) store, so hits survive restarts.
+3. Structured Responses: Pydantic responses are stored as JSON and re-validated
+   into the requested model on a hit.
+4. Expiry: Entries expire after one day so stale answers do not linger forever.
+
+Main Components:
+- cached_llm: Decorator that wraps a sync, async or streaming LLM prompt function with the cache.
+
+Usage:
+    from ada.modules.llm_cache import cached_llm
+
+    @cached_llm
+    def my_prompt(prompt: str, pydantic_model: BaseModel = None) -> BaseModel:
+        ...
+
+Dependencies:
+- diskcache: For the persistent SQLite-backed key-value store.
+- hashlib, json: For building stable cache keys.
+- weakref: For remembering the JSON schema of each response model.
+- logging: For reporting cache hits, silent unless DEBUG logging is enabled.
+
+Note:
+The cache location can be changed with the LLM_CACHE_DIR environment variable.
+Delete the directory to drop all cached responses.
+"""
+
+import functools
+import hashlib
+import inspect
+import json
+import logging
+import os
+import weakref
+
+import diskcache
+from pydantic import BaseModel
+
+LLM_CACHE_DIR = os.getenv("LLM_CACHE_DIR", "./.ada_cache")
+LLM_CACHE_EXPIRE = 86400  # seconds
+
+logger = logging.getLogger(__name__)
+
+_cache = diskcache.Cache(LLM_CACHE_DIR)
+_schemas = weakref.WeakKeyDictionary()
+
+
+def _model_schema(pydantic_model: BaseModel) -> dict:
+    """Return the JSON schema of a response model, generated once per model class."""
+    schema = _schemas.get(pydantic_model)
+    if schema is None:
+        schema = _schemas[pydantic_model] = pydantic_model.model_json_schema()
+    return schema
+
+
+def _cache_key(
+    model_name: str, prompt: str, options: dict, pydantic_model: BaseModel = None
+) -> str:
+    """Build a stable sha256 key for a prompt and its response model."""
+    payload = {
+        "model": model_name,
+        "prompt": prompt,
+        "options": options,
+        "schema": _model_schema(pydantic_model) if pydantic_model else None,
+    }
+    return hashlib.sha256(
+        json.dumps(payload, sort_keys=True, default=str).encode("utf-8")
+    ).hexdigest()
+
+
+def cached_llm(func):
+    """
+    Cache the responses of an LLM prompt function on disk.
+
+    The wrapped function (sync, async or a generator of text chunks) must take a
+    `prompt` argument and may take a `pydantic_model` argument; every other
+    argument (model, instructions, ...) becomes part of the cache key.
+    """
+    signature = inspect.signature(func)
+
+    def lookup(args, kwargs):
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        options = dict(bound.arguments)
+        prompt = options.pop("prompt")
+        pydantic_model = options.pop("pydantic_model", None)
+
+        # Sync, async and streaming variants of the same prompt function share entries
+        key = _cache_key(
+            func.__name__.removesuffix("_async").removesuffix("_stream"),
+            prompt,
+            options,
+            pydantic_model,
+        )
+        cached = _cache.get(key)
+        if cached is not None:
+            logger.debug("LLM cache hit for %s", func.__name__)
+            if pydantic_model:
+                cached = pydantic_model.model_validate_json(cached)
+        return key, pydantic_model, cached
+
+    def store(key, pydantic_model, response):
+        value = response.model_dump_json() if pydantic_model else response
+        _cache.set(key, value, expire=LLM_CACHE_EXPIRE)
+
+    if inspect.iscoroutinefunction(func):
+
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            key, pydantic_model, cached = lookup(args, kwargs)
+            if cached is not None:
+                return cached
+            response = await func(*args, **kwargs)
+            store(key, pydantic_model, response)
+            return response
+
+        return async_wrapper
+
+    if inspect.isgeneratorfunction(func):
+
+        @functools.wraps(func)
+        def stream_wrapper(*args, **kwargs):
+            key, pydantic_model, cached = lookup(args, kwargs)
+            if cached is not None:
+                yield cached
+                return
+            chunks = []
+            for chunk in func(*args, **kwargs):
+                chunks.append(chunk)
+                yield chunk
+            # Only a fully consumed stream is stored
+            store(key, pydantic_model, "".join(chunks))
+
+        return stream_wrapper
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        key, pydantic_model, cached = lookup(args, kwargs)
+        if cached is not None:
+            return cached
+        response = func(*args, **kwargs)
+        store(key, pydantic_model, response)
+        return response
+
+    return wrapper
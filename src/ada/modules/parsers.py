@@ -7,9 +7,9 @@ JSON responses that may include additional formatting or markdown-style code blo
 
 Key Features:
 1. JSON Extraction: Capable of extracting JSON content from within markdown-style
-   code blocks (```json ... ```) using regular expressions.
-2. Flexible Parsing: Handles both clean JSON strings and those embedded within
-   other text or formatting.
+   code blocks (```json ... ```) using a precompiled regular expression.
+2. Flexible Parsing: Handles both clean JSON strings (parsed directly, without the
+   regex) and those embedded within other text or formatting.
 3. Error Handling: Gracefully handles parsing errors, returning None instead of
    raising exceptions for invalid JSON.
 
@@ -43,8 +43,8 @@ Usage Example:
         print("Failed to parse JSON")
 
 Dependencies:
-- json: For JSON parsing functionality.
-- re: For regular expression operations to extract JSON from code blocks.
+- orjson: For fast JSON parsing.
+- re: For the precompiled regular expression that extracts JSON from code blocks.
 
 Note:
 This module is particularly useful when working with AI models that may return
@@ -56,9 +56,12 @@ Date: [Current Date]
 Version: 1.0
 """
 
-import json
 import re
 
+import orjson
+
+JSON_FENCE = re.compile(r"```json\s*(.*?)\s*```", re.DOTALL)
+
 
 def parse_json_from_gemini(json_str: str):
     """Parses a dictionary from a JSON-like object string.
@@ -80,12 +83,19 @@ def parse_json_from_gemini(json_str: str):
         # Remove potential leading/trailing whitespace
         json_str = json_str.strip()
 
+        # Most responses are clean JSON, only look for a code block when that fails
+        try:
+            return orjson.loads(json_str)
+        except orjson.JSONDecodeError:
+            if "```" not in json_str:
+                return None
+
         # Extract JSON content from triple backticks and "json" language specifier
-        json_match = re.search(r"```json\s*(.*?)\s*```", json_str, re.DOTALL)
+        json_match = JSON_FENCE.search(json_str)
 
         if json_match:
             json_str = json_match.group(1)
 
-        return json.loads(json_str)
-    except (json.JSONDecodeError, AttributeError):
+        return orjson.loads(json_str)
+    except (orjson.JSONDecodeError, AttributeError):
         return None
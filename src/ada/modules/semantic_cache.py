@@ -0,0 +1,140 @@
+"""
+semantic_cache.py - Embedding-based Response Cache for ADA AI Assistant
+
+This module implements a small semantic cache: responses are stored alongside a
+sentence embedding of the message that produced them, and a new message that is
+close enough in meaning to a cached one returns the cached response instead of
+calling the LLM again. ADA uses it for short status/feedback messages, which
+repeat with minor wording changes across workflows.
+
+Key Features:
+1. Local Embeddings: Runs the ONNX export of the sentence-transformers 'all-MiniLM-L6-v2'
+   model with onnxruntime (384 dimensions, a few milliseconds per message on CPU), without
+   pulling in torch for a handful of short messages.
+2. Lazy Loading: The embedding model is only downloaded and loaded on first use.
+3. Vectorized Lookup: Cached embeddings are kept in a single float32 numpy matrix,
+   so a lookup is one matrix-vector product.
+4. Persistence: Embeddings and responses are pickled to disk after every insert.
+5. Context Keys: The cache file records a sha256 of the embedding model and of a caller
+   supplied context (e.g. the prompts that produced the responses). A file written for
+   another context is discarded on load, so edited prompts never replay stale responses.
+
+Main Components:
+- SemanticCache: The cache class.
+  - get: Returns the cached response for the most similar message, or None.
+  - put: Stores a new message/response pair.
+
+Usage:
+    cache = SemanticCache("feedback_cache.pkl", context=SYSTEM_PROMPT + PROMPT_TEMPLATE)
+    response = cache.get(message)
+    if response is None:
+        response = llm.gpro_1_5_prompt(prompt)
+        cache.put(message, response)
+
+Dependencies:
+- onnxruntime, tokenizers: For computing the message embeddings.
+- huggingface_hub: For downloading the model and tokenizer files once.
+- numpy: For storing embeddings and computing cosine similarities.
+- pickle: For persisting the cache to disk.
+- hashlib: For the context key of the cache file.
+"""
+
+import hashlib
+import os
+import pickle
+
+import numpy as np
+
+# ONNX export of sentence-transformers/all-MiniLM-L6-v2
+EMBEDDING_MODEL_NAME = "Xenova/all-MiniLM-L6-v2"
+EMBEDDING_DIMENSIONS = 384
+EMBEDDING_MAX_TOKENS = 256
+
+
+def _load_embedding_model():
+    """Download (once) and load the tokenizer and ONNX session of the embedding model."""
+    import onnxruntime
+    from huggingface_hub import hf_hub_download
+    from tokenizers import Tokenizer
+
+    tokenizer = Tokenizer.from_file(
+        hf_hub_download(EMBEDDING_MODEL_NAME, "tokenizer.json")
+    )
+    tokenizer.enable_truncation(max_length=EMBEDDING_MAX_TOKENS)
+    tokenizer.no_padding()
+    session = onnxruntime.InferenceSession(
+        hf_hub_download(EMBEDDING_MODEL_NAME, "onnx/model.onnx"),
+        providers=["CPUExecutionProvider"],
+    )
+    return tokenizer, session
+
+
+class SemanticCache:
+    def __init__(self, cache_file="feedback_cache.pkl", threshold=0.92, context=""):
+        self.cache_file = cache_file
+        self.threshold = threshold
+        self.context_key = hashlib.sha256(
+            f"{EMBEDDING_MODEL_NAME}\n{context}".encode()
+        ).hexdigest()
+        self._model = None
+        self._last_encoded = (None, None)
+        self.embeddings = np.empty((0, EMBEDDING_DIMENSIONS), dtype=np.float32)
+        self.responses = []
+        if os.path.exists(cache_file):
+            with open(cache_file, "rb") as file:
+                cached = pickle.load(file)
+            # Responses cached for other prompts (or by an older version) are dropped
+            if isinstance(cached, dict) and cached["context_key"] == self.context_key:
+                self.embeddings = cached["embeddings"]
+                self.responses = cached["responses"]
+
+    def _encode(self, message: str) -> np.ndarray:
+        # A miss is usually followed by a put of the same message, reuse its embedding
+        last_message, last_embedding = self._last_encoded
+        if message == last_message:
+            return last_embedding
+        if self._model is None:
+            self._model = _load_embedding_model()
+        tokenizer, session = self._model
+        encoding = tokenizer.encode(message)
+        inputs = {
+            "input_ids": np.array([encoding.ids], dtype=np.int64),
+            "attention_mask": np.array([encoding.attention_mask], dtype=np.int64),
+            "token_type_ids": np.array([encoding.type_ids], dtype=np.int64),
+        }
+        # Only feed the inputs this export declares
+        input_names = {model_input.name for model_input in session.get_inputs()}
+        token_embeddings = session.run(
+            None, {name: value for name, value in inputs.items() if name in input_names}
+        )[0]
+        # Mean pooling and L2 normalization, as sentence-transformers does (one unpadded message)
+        embedding = token_embeddings.mean(axis=1).astype(np.float32)
+        embedding /= np.linalg.norm(embedding, axis=1, keepdims=True)
+        self._last_encoded = (message, embedding)
+        return embedding
+
+    def get(self, message: str):
+        """Return the cached response for a similar message, or None on a miss."""
+        if not self.responses:
+            return None
+        query = self._encode(message)
+        # Embeddings are normalized, so the dot product is the cosine similarity
+        similarities = (self.embeddings @ query.T).ravel()
+        best = int(similarities.argmax())
+        if similarities[best] > self.threshold:
+            return self.responses[best]
+        return None
+
+    def put(self, message: str, response: str):
+        """Store the response for a message and persist the cache to disk."""
+        self.embeddings = np.vstack([self.embeddings, self._encode(message)])
+        self.responses.append(response)
+        with open(self.cache_file, "wb") as file:
+            pickle.dump(
+                {
+                    "context_key": self.context_key,
+                    "embeddings": self.embeddings,
+                    "responses": self.responses,
+                },
+                file,
+            )
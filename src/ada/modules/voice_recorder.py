@@ -15,8 +15,10 @@ Key Features:
 Main Components:
 - VoiceRecorder: The main class that handles voice recognition and command processing.
   - __init__: Initializes the recorder with model path and keywords.
-  - callback: Callback function for the audio stream to queue audio data.
-  - continuous_listen: Main loop for continuous audio processing.
+  - callback: Callback function for the audio stream to queue audio data (bounded, drops the oldest).
+  - next_buffer: Hands the callback a preallocated buffer to copy the audio into.
+  - continuous_listen: Main loop for continuous audio processing (activates on partial results).
+  - find_keywords: Finds the activation, end and stop keywords in a transcript.
   - process_result: Processes each recognized speech segment.
   - start_interaction: Begins recording an interaction.
   - stop_interaction: Ends recording and processes the captured command.
@@ -30,7 +32,8 @@ Dependencies:
 - sounddevice: For capturing audio from the microphone.
 - numpy: For handling audio data arrays.
 - vosk: For speech recognition.
-- queue: For queuing audio data between callbacks and processing.
+- collections, threading: For handing audio data from the callback to the recognizer (deque + Event).
+- json: For parsing the recognizer results.
 
 Note:
 This module is designed to be used as part of the ADA AI Assistant system. It provides
@@ -46,11 +49,19 @@ Date: [Current Date]
 Version: 1.0
 """
 
-import queue
+import json
+import re
+import threading
+from collections import deque
 
 import sounddevice as sd
 import vosk
 
+# Audio buffers waiting for recognition (about 16s), the oldest are dropped when recognition falls behind
+AUDIO_QUEUE_SIZE = 256
+# 64ms blocks at 16kHz, small enough not to delay recognition
+AUDIO_BLOCK_FRAMES = 1024
+
 
 class VoiceRecorder:
     def __init__(
@@ -66,41 +77,96 @@ class VoiceRecorder:
         self.activation_keyword = activation_keyword.lower()
         self.end_keyword = end_keyword.lower()
         self.stop_keyword = stop_keyword.lower()
-        self.interaction_transcript = ""
+        # All keywords are found in a single scan of each transcript
+        self.keyword_pattern = re.compile(
+            f"(?P<activation>{re.escape(self.activation_keyword)})"
+            f"|(?P<end>{re.escape(self.end_keyword)})"
+            f"|(?P<stop>{re.escape(self.stop_keyword)})"
+        )
+        # Recognized segments of the current interaction, joined once when it ends
+        self.transcript_segments = []
         self.recording = False
-        self.q = queue.Queue()
+        # Single producer (the audio callback) and single consumer (the listener), so
+        # deque's atomic append/popleft and an Event replace a locking queue.Queue
+        self.audio_buffers = deque()
+        self.audio_ready = threading.Event()
+        # Preallocated int16 buffers, the callback copies into them instead of allocating
+        self.free_buffers = deque(
+            bytearray(AUDIO_BLOCK_FRAMES * 2) for _ in range(2 * AUDIO_QUEUE_SIZE)
+        )
+
+    def next_buffer(self):
+        """Return a free audio buffer, or the oldest queued one when recognition fell behind."""
+        if len(self.audio_buffers) < AUDIO_QUEUE_SIZE:
+            try:
+                return self.free_buffers.popleft()
+            except IndexError:
+                pass
+        try:
+            return self.audio_buffers.popleft()
+        except IndexError:
+            # The listener just took every queued buffer, grow the pool
+            return bytearray(AUDIO_BLOCK_FRAMES * 2)
 
     def callback(self, indata, frames, time, status):
-        self.q.put(bytes(indata))
+        buffer = self.next_buffer()
+        buffer[:] = indata
+        self.audio_buffers.append(buffer)
+        self.audio_ready.set()
 
     def continuous_listen(self):
         with sd.RawInputStream(
             callback=self.callback,
             device=self.device,
+            blocksize=AUDIO_BLOCK_FRAMES,
             dtype="int16",
             channels=1,
             samplerate=16000,
         ) as stream:
             rec = vosk.KaldiRecognizer(self.model, stream.samplerate)
             while True:
-                data = self.q.get()
+                self.audio_ready.wait()
+                self.audio_ready.clear()
+                # Feed the whole backlog to the recognizer in a single call
+                buffers = []
+                while True:
+                    try:
+                        buffers.append(self.audio_buffers.popleft())
+                    except IndexError:
+                        break
+                if not buffers:
+                    continue
+                data = b"".join(buffers)
+                self.free_buffers.extend(buffers)
                 if rec.AcceptWaveform(data):
                     result = rec.Result()
-                    continue_listening = self.process_result(eval(result)["text"])
+                    continue_listening = self.process_result(json.loads(result)["text"])
                     if not continue_listening:
                         print("Shutting down the listening process.")
                         break
+                elif not self.recording:
+                    # Start on the partial hypothesis instead of waiting for the speaker to pause
+                    partial = json.loads(rec.PartialResult())["partial"]
+                    if "activation" in self.find_keywords(partial):
+                        self.start_interaction()
+
+    def find_keywords(self, transcript):
+        """Return the kinds of keywords ("activation", "end", "stop") found in the transcript."""
+        return {match.lastgroup for match in self.keyword_pattern.finditer(transcript)}
 
     def process_result(self, transcript):
         print(f"Detected: {transcript}")
-        if self.activation_keyword in transcript and not self.recording:
-            self.start_interaction()
-        elif self.end_keyword in transcript and self.recording:
+        keywords = self.find_keywords(transcript)
+        # A partial result may already have started the interaction for this utterance
+        if "activation" in keywords and not self.transcript_segments:
+            if not self.recording:
+                self.start_interaction()
+        elif "end" in keywords and self.recording:
             self.stop_interaction()
-        elif self.stop_keyword in transcript:
+        elif "stop" in keywords:
             return False
         if self.recording:
-            self.interaction_transcript += " " + transcript
+            self.transcript_segments.append(transcript)
         return True
 
     def start_interaction(self):
@@ -109,8 +175,9 @@ class VoiceRecorder:
 
     def stop_interaction(self):
         print("Stopping interaction ...")
-        self.process_command(self.interaction_transcript)
-        self.interaction_transcript = ""
+        transcript = " ".join(self.transcript_segments)
+        self.transcript_segments.clear()
+        self.process_command(transcript)
         self.recording = False
 
     def process_command(self, transcript):